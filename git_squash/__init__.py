@@ -4,13 +4,12 @@ Git Squash Tool - Clean Architecture Implementation
 A tool for intelligently squashing git commits with AI-powered summaries.
 """
 
-__version__ = "2.0.0"
+__version__ = "0.1.0"
 
 from .core.config import GitSquashConfig
 from .core.types import CommitInfo, SquashPlan, ChangeAnalysis
 from .git.operations import GitOperations
 from .ai.interface import AIClient
-from .ai.claude import ClaudeClient
 from .ai.mock import MockAIClient
 from .tool import GitSquashTool
 
@@ -24,4 +23,11 @@ __all__ = [
     "ClaudeClient", 
     "MockAIClient",
     "GitSquashTool"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name == "ClaudeClient":
+        from . import ai
+        return ai.ClaudeClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
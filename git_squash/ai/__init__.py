@@ -1,7 +1,14 @@
 """AI clients for generating commit summaries."""
 
 from .interface import AIClient
-from .claude import ClaudeClient
 from .mock import MockAIClient
 
-__all__ = ["AIClient", "ClaudeClient", "MockAIClient"]
\ No newline at end of file
+__all__ = ["AIClient", "ClaudeClient", "MockAIClient"]
+
+
+def __getattr__(name):
+    # ClaudeClient pulls in the anthropic SDK, so resolve it on first access
+    if name == "ClaudeClient":
+        from .claude import ClaudeClient
+        return ClaudeClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
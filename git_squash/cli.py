@@ -1,5 +1,6 @@
 """Command line interface for the git squash tool."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import argparse
@@ -8,15 +9,20 @@ import logging
 import os
 import sys
 
+from . import __version__
 from .core.config import GitSquashConfig
 from .core.types import GitSquashError, NoCommitsFoundError, InvalidDateRangeError
 from .git.operations import GitOperations
-from .ai.claude import ClaudeClient
 from .ai.mock import MockAIClient
 from .tool import GitSquashTool
 
 logger = logging.getLogger(__name__)
 
+VERSION_FLAGS = ('--version', '-V')
+
+_YES = frozenset({'y', 'yes'})
+_NO = frozenset({'n', 'no'})
+
 
 def setup_logging(verbose: bool = False):
     """Setup logging configuration."""
@@ -34,8 +40,23 @@ def setup_logging(verbose: bool = False):
     logging.getLogger('requests').setLevel(logging.WARNING)
 
 
+def _version_string() -> str:
+    """Version line for --version, preferring the installed package metadata."""
+    # importlib.metadata is only needed here, so keep it off the startup path
+    from importlib import metadata
+    try:
+        version = metadata.version("git-squash-py")
+    except metadata.PackageNotFoundError:
+        version = __version__
+    return f"git-squash {version}"
+
+
+@lru_cache(maxsize=1)
 def create_argument_parser() -> argparse.ArgumentParser:
-    """Create the command line argument parser."""
+    """Create the command line argument parser.
+
+    The parser is built once and reused; parse_args() does not mutate it.
+    """
     parser = argparse.ArgumentParser(
         description='Git Squash Tool - Intelligent commit summarization with Claude',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -176,12 +197,21 @@ Environment Variables:
         metavar='BRANCH'
     )
 
+    parser.add_argument(
+        *VERSION_FLAGS,
+        action='version',
+        version=_version_string()
+    )
+
     return parser
 
 
 def validate_environment(use_test_mode: bool) -> None:
     """Validate required environment variables."""
-    if not use_test_mode and not os.environ.get('ANTHROPIC_API_KEY'):
+    if use_test_mode:
+        return
+
+    if not os.environ.get('ANTHROPIC_API_KEY'):
         print("Error: ANTHROPIC_API_KEY environment variable not set", file=sys.stderr)
         print("Either set the API key or use --test-mode for testing", file=sys.stderr)
         sys.exit(1)
@@ -193,6 +223,8 @@ def create_ai_client(args, config: GitSquashConfig, cache_dir: Optional[Path] =
         logger.info("Using mock AI client")
         return MockAIClient(config)
     else:
+        # Deferred so test mode and --help never load the anthropic SDK
+        from git_squash.ai.claude import ClaudeClient
         logger.info("Using Claude AI client with caching")
         return ClaudeClient(config=config, cache_dir=cache_dir)
 
@@ -229,32 +261,31 @@ def save_plan_to_file(plan, filename: str) -> None:
 
 def display_plan(plan) -> None:
     """Display the squash plan to the user."""
-    print("\n" + "=" * 80)
-    print("SQUASH PLAN")
-    print("=" * 80)
+    # Build the whole block and write it once rather than per line
+    lines = ["", "=" * 80, "SQUASH PLAN", "=" * 80]
     
     for item in plan.items:
         part_str = f" (part {item.part})" if item.part else ""
-        print(f"\n{item.date}{part_str}: {len(item.commits)} commits")
-        print(f"Range: {item.start_hash[:8]}..{item.end_hash[:8]}")
-        print(f"Message length: {len(item.summary)} chars")
+        lines.append(f"\n{item.date}{part_str}: {len(item.commits)} commits")
+        lines.append(f"Range: {item.start_hash[:8]}..{item.end_hash[:8]}")
+        lines.append(f"Message length: {len(item.summary)} chars")
         
-        print("\nCommit message:")
-        print("-" * 40)
-        for line in item.summary.split('\n'):
-            print(line)
-        print("-" * 40)
+        lines.append("\nCommit message:")
+        lines.append("-" * 40)
+        lines.append(item.summary)
+        lines.append("-" * 40)
     
-    print(f"\nSummary: {plan.summary_stats()}")
+    lines.append(f"\nSummary: {plan.summary_stats()}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def confirm_execution() -> bool:
     """Ask user to confirm execution."""
     while True:
-        response = input("\nProceed with squashing? (y/n): ").lower().strip()
-        if response in ('y', 'yes'):
+        response = input("\nProceed with squashing? (y/n): ").strip().lower()
+        if response in _YES:
             return True
-        elif response in ('n', 'no'):
+        elif response in _NO:
             return False
         else:
             print("Please enter 'y' or 'n'")
@@ -405,6 +436,13 @@ async def async_main(args: Optional[list] = None) -> int:
 
 def main(args: Optional[list] = None) -> int:
     """Main entry point for the CLI."""
+    argv = sys.argv[1:] if args is None else args
+
+    # Answer --version without building the parser or starting an event loop
+    if argv and argv[0] in VERSION_FLAGS:
+        print(_version_string())
+        return 0
+
     return asyncio.run(async_main(args))
 
 
@@ -137,5 +137,9 @@ class GitOperationError(GitSquashError):
 
 def can_import(module_name: str) -> bool:
     """Checks if a module can be imported without actually importing it."""
-    spec = importlib.util.find_spec(module_name)
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except ValueError:
+        # Already in sys.modules without a spec (e.g. the anthropic test mock)
+        return True
     return spec is not None
\ No newline at end of file
@@ -4,7 +4,7 @@ import os
 import subprocess
 import logging
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from ..core.types import CommitInfo, GitOperationError, SquashPlanItem
 from ..core.config import GitSquashConfig
 
@@ -14,8 +14,11 @@ logger = logging.getLogger(__name__)
 class GitOperations:
     """Handles all git operations for the squash tool."""
     
-    def __init__(self, config: Optional[GitSquashConfig] = None):
+    def __init__(self, config: Optional[GitSquashConfig] = None,
+                 cwd: Optional[Union[str, os.PathLike]] = None):
+        """Operate on the repository at cwd (default: the process working directory)."""
         self.config = config or GitSquashConfig()
+        self.cwd = cwd
         self._validate_git_repository()
     
     def _run_git_command(self, cmd: List[str], check: bool = True) -> subprocess.CompletedProcess:
@@ -26,6 +29,7 @@ class GitOperations:
         try:
             result = subprocess.run(
                 full_cmd,
+                cwd=self.cwd,
                 capture_output=True,
                 text=True,
                 check=check
@@ -220,6 +224,7 @@ class GitOperations:
 
         result = subprocess.run(
             ["git"] + cmd,
+            cwd=self.cwd,
             env=env,
             capture_output=True,
             text=True,
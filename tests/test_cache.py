@@ -1,6 +1,7 @@
 """Comprehensive tests for the GitSquashCache implementation."""
 import pytest
 import json
+import shutil
 import tempfile
 import time
 from datetime import datetime, timedelta
@@ -89,7 +90,6 @@ class TestGitSquashCache:
         self.config = GitSquashConfig()
 
         # Create test commits
-        from datetime import datetime
         self.commits = [
             CommitInfo(
                 hash="abc123",
@@ -121,7 +121,6 @@ class TestGitSquashCache:
 
     def teardown_method(self):
         """Clean up test fixtures."""
-        import shutil
         if Path(self.temp_dir).exists():
             shutil.rmtree(self.temp_dir)
 
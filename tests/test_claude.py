@@ -1,7 +1,9 @@
 """Comprehensive tests for the Claude AI client using anthropic library."""
 import pytest
 import os
-from unittest.mock import Mock, patch, AsyncMock, MagicMock
+from functools import lru_cache
+from pathlib import Path
+from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 
 # Import the modules we're testing
@@ -9,6 +11,92 @@ from git_squash.ai.claude import ClaudeClient, HAS_ANTHROPIC
 from git_squash.core.types import ChangeAnalysis, CommitCategories
 from git_squash.core.config import GitSquashConfig
 
+pytestmark = pytest.mark.skipif(not HAS_ANTHROPIC, reason="anthropic library not installed")
+
+# Async test classes share one module-scoped event loop
+async_module_loop = pytest.mark.asyncio(loop_scope="module")
+
+if HAS_ANTHROPIC:
+    from anthropic.types import Message, TextBlock, Usage
+
+    _BASE_MSG = Message(
+        id="msg_test_123",
+        type="message",
+        role="assistant",
+        content=[TextBlock(text="", type="text")],
+        model="claude-3-5-sonnet-20241022",
+        stop_reason="end_turn",
+        usage=Usage(input_tokens=100, output_tokens=50, total_tokens=150)
+    )
+
+
+def make_message(text, *, in_tok=100, out_tok=50):
+    """Build a mock ``Message`` response by copying a pre-validated base."""
+    return _BASE_MSG.model_copy(update={
+        "content": [TextBlock(text=text, type="text")],
+        "usage": Usage(input_tokens=in_tok, output_tokens=out_tok,
+                       total_tokens=in_tok + out_tok),
+    })
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@lru_cache(maxsize=None)
+def read_fixture(name):
+    """Read a test fixture file once and cache its contents."""
+    return (FIXTURES_DIR / name).read_text()
+
+
+@pytest.fixture(scope="session")
+def auth_diff():
+    """Sample diff of an OAuth-enabled user model."""
+    return read_fixture("auth_models.diff")
+
+
+# Malformed branch-name responses and their cleaned-up suffixes
+BRANCH_NAME_CLEANUP_CASES = (
+    ("<branch-name>Cache Layer Updates!</branch-name>", "cache-layer-updates"),
+    ("<branch-name>feature/cache_improvements</branch-name>", "featurecache-improvements"),
+    ("<branch-name>UPPERCASE-NAME</branch-name>", "uppercase-name"),
+    ("<branch-name>multiple---hyphens</branch-name>", "multiple-hyphens"),
+    ("<branch-name>-leading-trailing-</branch-name>", "leading-trailing"),
+)
+
+
+class _FakeMessages:
+    """Minimal stand-in for ``AsyncAnthropic.messages``."""
+
+    def __init__(self, response=None, side_effect=None):
+        self.response = response
+        self.side_effect = side_effect
+        self.calls = []
+
+    @property
+    def last_kwargs(self):
+        """Keyword arguments of the most recent ``create`` call."""
+        return self.calls[-1]
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.response
+
+
+class _FakeAnthropic:
+    """Lightweight async stub for ``AsyncAnthropic`` returning a preset response."""
+
+    def __init__(self, response=None, side_effect=None):
+        self.messages = _FakeMessages(response, side_effect)
+
+
+def _wire_anthropic(mock_cls, *, response=None, side_effect=None):
+    """Make the patched ``AsyncAnthropic`` class return a fake client."""
+    client = _FakeAnthropic(response, side_effect)
+    mock_cls.return_value = client
+    return client
+
 
 class TestClaudeClientInitialization:
     """Test Claude client initialization and configuration."""
@@ -17,9 +105,6 @@ class TestClaudeClientInitialization:
     @patch('git_squash.ai.claude.AsyncAnthropic')
     def test_init_with_env_api_key(self, mock_anthropic_class):
         """Test initialization with API key from environment."""
-        if not HAS_ANTHROPIC:
-            pytest.skip("anthropic library not installed")
-            
         client = ClaudeClient()
         
         assert client.api_key == 'test-key'
@@ -32,9 +117,6 @@ class TestClaudeClientInitialization:
     @patch('git_squash.ai.claude.AsyncAnthropic')
     def test_init_with_provided_api_key(self, mock_anthropic_class):
         """Test initialization with provided API key."""
-        if not HAS_ANTHROPIC:
-            pytest.skip("anthropic library not installed")
-            
         client = ClaudeClient(api_key='provided-key')
         
         assert client.api_key == 'provided-key'
@@ -47,9 +129,6 @@ class TestClaudeClientInitialization:
     @patch.dict('os.environ', {}, clear=True)
     def test_init_without_api_key_raises(self):
         """Test initialization fails without API key."""
-        if not HAS_ANTHROPIC:
-            pytest.skip("anthropic library not installed")
-            
         with pytest.raises(ValueError, match="ANTHROPIC_API_KEY must be set"):
             ClaudeClient()
     
@@ -63,9 +142,6 @@ class TestClaudeClientInitialization:
     @patch('git_squash.ai.claude.AsyncAnthropic')
     def test_init_with_custom_config(self, mock_anthropic_class):
         """Test initialization with custom configuration."""
-        if not HAS_ANTHROPIC:
-            pytest.skip("anthropic library not installed")
-            
         config = GitSquashConfig(
             model="claude-3-opus-20240229",
             total_message_limit=1000
@@ -77,14 +153,12 @@ class TestClaudeClientInitialization:
         assert client.config.total_message_limit == 1000
 
 
+@async_module_loop
 class TestClaudeClientSummaryGeneration:
     """Test commit summary generation."""
     
     def setup_method(self):
         """Set up test fixtures."""
-        if not HAS_ANTHROPIC:
-            pytest.skip("anthropic library not installed")
-            
         self.config = GitSquashConfig()
         
         # Create analysis fixture
@@ -116,54 +190,18 @@ class TestClaudeClientSummaryGeneration:
             "Optimize query performance"
         ]
         
-        self.diff_content = """diff --git a/cache.py b/cache.py
-new file mode 100644
-index 0000000..1234567
---- /dev/null
-+++ b/cache.py
-@@ -0,0 +1,100 @@
-+class Cache:
-+    def __init__(self):
-+        self.data = {}
-+    
-+    def get(self, key):
-+        return self.data.get(key)
-+    
-+    def set(self, key, value):
-+        self.data[key] = value
-"""
+        self.diff_content = read_fixture("cache.diff")
     
     @patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'})
     @patch('git_squash.ai.claude.AsyncAnthropic')
-    @pytest.mark.asyncio
     async def test_generate_summary_success(self, mock_anthropic_class):
         """Test successful summary generation."""
-        # Set up mock response
-        from anthropic.types import Message, TextBlock, Usage
-
-        mock_response = Message(
-            id="msg_test_123",
-            type="message",
-            role="assistant",
-            content=[
-                TextBlock(
-                    text="<commit-message>\nAdd cache layer with memory optimization\n\n- implement LRU cache with configurable size limits\n- fix: memory leak in cache cleanup logic\n- add comprehensive error handling for cache operations\n- tests: add unit tests with 95% coverage\n- performance: optimize query operations by 40%\n- note: Contains critical memory leak fix\n</commit-message>",
-                    type="text"
-                )
-            ],
-            model="claude-3-5-sonnet-20241022",
-            stop_reason="end_turn",
-            usage=Usage(
-                input_tokens=100,
-                output_tokens=50,
-                total_tokens=150
-            )
+        mock_response = make_message(
+            "<commit-message>\nAdd cache layer with memory optimization\n\n- implement LRU cache with configurable size limits\n- fix: memory leak in cache cleanup logic\n- add comprehensive error handling for cache operations\n- tests: add unit tests with 95% coverage\n- performance: optimize query operations by 40%\n- note: Contains critical memory leak fix\n</commit-message>"
         )
         
         # Set up mock client
-        mock_client = AsyncMock()
-        mock_client.messages.create = AsyncMock(return_value=mock_response)
-        mock_anthropic_class.return_value = mock_client
+        mock_client = _wire_anthropic(mock_anthropic_class, response=mock_response)
         
         # Create client and generate summary
         client = ClaudeClient()
@@ -180,11 +218,11 @@ index 0000000..1234567
         assert "note: Contains critical memory leak fix" in summary
         
         # Verify API call
-        mock_client.messages.create.assert_called_once()
-        call_args = mock_client.messages.create.call_args
-        assert call_args.kwargs['model'] == self.config.model
-        assert call_args.kwargs['max_tokens'] == 1024
-        assert call_args.kwargs['temperature'] == 0.3
+        assert len(mock_client.messages.calls) == 1
+        call_kwargs = mock_client.messages.last_kwargs
+        assert call_kwargs['model'] == self.config.model
+        assert call_kwargs['max_tokens'] == 1024
+        assert call_kwargs['temperature'] == 0.3
         
         # Verify usage tracking
         assert client._request_count == 1
@@ -192,35 +230,15 @@ index 0000000..1234567
     
     @patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'})
     @patch('git_squash.ai.claude.AsyncAnthropic')
-    @pytest.mark.asyncio
     async def test_generate_summary_retry_on_length(self, mock_anthropic_class):
         """Test retry logic when summary is too long."""
-        # Set up mock response with proper anthropic types
-        from anthropic.types import Message, TextBlock, Usage
-
         # Mock response for retry attempt with guidance to be more concise
-        mock_response = Message(
-            id="msg_test_123",
-            type="message",
-            role="assistant",
-            content=[
-                TextBlock(
-                    text="<commit-message>Add cache layer\n\n- implement basic cache functionality</commit-message>",
-                    type="text"
-                )
-            ],
-            model="claude-3-5-sonnet-20241022",
-            stop_reason="end_turn",
-            usage=Usage(
-                input_tokens=120,
-                output_tokens=30,
-                total_tokens=150
-            )
+        mock_response = make_message(
+            "<commit-message>Add cache layer\n\n- implement basic cache functionality</commit-message>",
+            in_tok=120, out_tok=30
         )
 
-        mock_client = AsyncMock()
-        mock_client.messages.create = AsyncMock(return_value=mock_response)
-        mock_anthropic_class.return_value = mock_client
+        mock_client = _wire_anthropic(mock_anthropic_class, response=mock_response)
         
         # Create client with small message limit
         config = GitSquashConfig(total_message_limit=100)
@@ -242,73 +260,49 @@ index 0000000..1234567
         assert "implement basic cache functionality" in summary
 
         # Verify the prompt includes length guidance for retry
-        mock_client.messages.create.assert_called_once()
-        call_args = mock_client.messages.create.call_args
-        user_prompt = call_args.kwargs['messages'][0]['content']
+        assert len(mock_client.messages.calls) == 1
+        user_prompt = mock_client.messages.last_kwargs['messages'][0]['content']
         assert "Previous summary was 2000 chars" in user_prompt
         assert f"more concise version under {config.total_message_limit} chars" in user_prompt
     
     @patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'})
     @patch('git_squash.ai.claude.AsyncAnthropic')
-    @pytest.mark.asyncio
     async def test_generate_summary_fallback_on_error(self, mock_anthropic_class):
         """Test fallback summary generation on API error."""
         # Import anthropic exceptions
-        if HAS_ANTHROPIC:
-            import anthropic
-            
-            # Set up mock client that raises an error
-            mock_request = AsyncMock()
-            mock_client = AsyncMock()
-            mock_client.messages.create = AsyncMock(
-                side_effect=anthropic.APIConnectionError(message="Connenction failed", request=mock_request)
-            )
-            mock_anthropic_class.return_value = mock_client
-            
-            client = ClaudeClient()
-            summary = await client.generate_summary(
-                date="2025-01-15",
-                analysis=self.analysis,
-                commit_subjects=self.commit_subjects,
-                diff_content=self.diff_content
-            )
-            
-            # Should return fallback summary
-            assert "Add 2 features, 1 fixes" in summary
-            assert "- feature: add cache layer" in summary
-            assert "- fix: fix memory leak" in summary
-            assert "- note: Contains critical" in summary
+        import anthropic
+
+        # Set up mock client that raises an error
+        mock_request = Mock(spec=[])
+        _wire_anthropic(
+            mock_anthropic_class,
+            side_effect=anthropic.APIConnectionError(message="Connenction failed", request=mock_request)
+        )
+        
+        client = ClaudeClient()
+        summary = await client.generate_summary(
+            date="2025-01-15",
+            analysis=self.analysis,
+            commit_subjects=self.commit_subjects,
+            diff_content=self.diff_content
+        )
+        
+        # Should return fallback summary
+        assert "Add 2 features, 1 fixes" in summary
+        assert "- feature: add cache layer" in summary
+        assert "- fix: fix memory leak" in summary
+        assert "- note: Contains critical" in summary
     
     @patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'})
     @patch('git_squash.ai.claude.AsyncAnthropic')
-    @pytest.mark.asyncio
     async def test_generate_summary_no_structured_response(self, mock_anthropic_class):
         """Test handling of non-structured response."""
-        # Set up mock response with proper anthropic types
-        from anthropic.types import Message, TextBlock, Usage
-
-        mock_response = Message(
-            id="msg_test_123",
-            type="message",
-            role="assistant",
-            content=[
-                TextBlock(
-                    text="Add cache layer with improvements\n\nThis adds a new caching system.",
-                    type="text"
-                )
-            ],
-            model="claude-3-5-sonnet-20241022",
-            stop_reason="end_turn",
-            usage=Usage(
-                input_tokens=80,
-                output_tokens=30,
-                total_tokens=110
-            )
+        mock_response = make_message(
+            "Add cache layer with improvements\n\nThis adds a new caching system.",
+            in_tok=80, out_tok=30
         )
         
-        mock_client = AsyncMock()
-        mock_client.messages.create = AsyncMock(return_value=mock_response)
-        mock_anthropic_class.return_value = mock_client
+        _wire_anthropic(mock_anthropic_class, response=mock_response)
         
         client = ClaudeClient()
         summary = await client.generate_summary(
@@ -321,14 +315,12 @@ index 0000000..1234567
         assert "Add cache layer with improvements" in summary
 
 
+@async_module_loop
 class TestClaudeClientBranchNameGeneration:
     """Test branch name generation."""
     
     def setup_method(self):
         """Set up test fixtures."""
-        if not HAS_ANTHROPIC:
-            pytest.skip("anthropic library not installed")
-            
         self.summaries = [
             "Add cache layer with memory optimization\n\n- implement LRU cache\n- fix memory leaks",
             "Optimize database queries\n\n- add query caching\n- improve index usage",
@@ -337,34 +329,14 @@ class TestClaudeClientBranchNameGeneration:
     
     @patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'})
     @patch('git_squash.ai.claude.AsyncAnthropic')
-    @pytest.mark.asyncio
     async def test_suggest_branch_name_success(self, mock_anthropic_class):
         """Test successful branch name suggestion."""
-        # Set up mock response with proper anthropic types
-        from anthropic.types import Message, TextBlock, Usage
-
-        mock_response = Message(
-            id="msg_test_123",
-            type="message",
-            role="assistant",
-            content=[
-                TextBlock(
-                    text="<branch-name>cache-optimization</branch-name>",
-                    type="text"
-                )
-            ],
-            model="claude-3-5-sonnet-20241022",
-            stop_reason="end_turn",
-            usage=Usage(
-                input_tokens=50,
-                output_tokens=10,
-                total_tokens=60
-            )
+        mock_response = make_message(
+            "<branch-name>cache-optimization</branch-name>",
+            in_tok=50, out_tok=10
         )
         
-        mock_client = AsyncMock()
-        mock_client.messages.create = AsyncMock(return_value=mock_response)
-        mock_anthropic_class.return_value = mock_client
+        mock_client = _wire_anthropic(mock_anthropic_class, response=mock_response)
         
         client = ClaudeClient()
         branch_name = await client.suggest_branch_name(self.summaries)
@@ -372,65 +344,29 @@ class TestClaudeClientBranchNameGeneration:
         assert branch_name == "cache-optimization"
         
         # Verify API call
-        mock_client.messages.create.assert_called_once()
-        call_args = mock_client.messages.create.call_args
-        assert call_args.kwargs['max_tokens'] == 50
-        assert call_args.kwargs['temperature'] == 0.5
+        assert len(mock_client.messages.calls) == 1
+        call_kwargs = mock_client.messages.last_kwargs
+        assert call_kwargs['max_tokens'] == 50
+        assert call_kwargs['temperature'] == 0.5
     
     @patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'})
     @patch('git_squash.ai.claude.AsyncAnthropic')
-    @pytest.mark.asyncio
-    async def test_suggest_branch_name_cleanup(self, mock_anthropic_class):
+    @pytest.mark.parametrize("response_text,expected", BRANCH_NAME_CLEANUP_CASES,
+                             ids=[expected for _, expected in BRANCH_NAME_CLEANUP_CASES])
+    async def test_suggest_branch_name_cleanup(self, mock_anthropic_class, response_text, expected):
         """Test branch name cleanup and validation."""
-        # Set up proper anthropic types
-        from anthropic.types import Message, TextBlock, Usage
-
-        # Test various malformed responses
-        test_cases = [
-            ("<branch-name>Cache Layer Updates!</branch-name>", "cache-layer-updates"),
-            ("<branch-name>feature/cache_improvements</branch-name>", "featurecache-improvements"),
-            ("<branch-name>UPPERCASE-NAME</branch-name>", "uppercase-name"),
-            ("<branch-name>multiple---hyphens</branch-name>", "multiple-hyphens"),
-            ("<branch-name>-leading-trailing-</branch-name>", "leading-trailing"),
-        ]
-        
-        mock_client = AsyncMock()
-        mock_anthropic_class.return_value = mock_client
+        _wire_anthropic(mock_anthropic_class,
+                        response=make_message(response_text, in_tok=50, out_tok=10))
         
         client = ClaudeClient()
-        
-        for response_text, expected in test_cases:
-            mock_response = Message(
-                id="msg_test_123",
-                type="message",
-                role="assistant",
-                content=[
-                    TextBlock(
-                        text=response_text,
-                        type="text"
-                    )
-                ],
-                model="claude-3-5-sonnet-20241022",
-                stop_reason="end_turn",
-                usage=Usage(
-                    input_tokens=50,
-                    output_tokens=10,
-                    total_tokens=60
-                )
-            )
-            mock_client.messages.create = AsyncMock(return_value=mock_response)
-            
-            branch_name = await client.suggest_branch_name(self.summaries)
-            assert branch_name == expected
+        branch_name = await client.suggest_branch_name(self.summaries)
+        assert branch_name == expected
     
     @patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'})
     @patch('git_squash.ai.claude.AsyncAnthropic')
-    @pytest.mark.asyncio
     async def test_suggest_branch_name_fallback(self, mock_anthropic_class):
         """Test fallback branch name on error."""
-        mock_client = AsyncMock()
-        mock_client.messages.create = AsyncMock(side_effect=Exception("API Error"))
-        mock_anthropic_class.return_value = mock_client
+        _wire_anthropic(mock_anthropic_class, side_effect=Exception("API Error"))
         
         client = ClaudeClient()
         branch_name = await client.suggest_branch_name(self.summaries)
@@ -443,9 +379,6 @@ class TestClaudeClientHelperMethods:
     
     def setup_method(self):
         """Set up test fixtures."""
-        if not HAS_ANTHROPIC:
-            pytest.skip("anthropic library not installed")
-            
         with patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'}):
             with patch('git_squash.ai.claude.AsyncAnthropic'):
                 self.client = ClaudeClient()
@@ -575,24 +508,19 @@ class TestClaudeClientHelperMethods:
         assert stats['average_tokens_per_request'] == 200
 
 
+@async_module_loop
 class TestClaudeClientEdgeCases:
     """Test edge cases and error conditions."""
     
     @patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'})
     @patch('git_squash.ai.claude.AsyncAnthropic')
-    @pytest.mark.asyncio
     async def test_empty_response_handling(self, mock_anthropic_class):
         """Test handling of empty responses."""
-        if not HAS_ANTHROPIC:
-            pytest.skip("anthropic library not installed")
-            
         # Empty content
         mock_response = Mock()
         mock_response.content = []
         
-        mock_client = AsyncMock()
-        mock_client.messages.create = AsyncMock(return_value=mock_response)
-        mock_anthropic_class.return_value = mock_client
+        _wire_anthropic(mock_anthropic_class, response=mock_response)
         
         client = ClaudeClient()
         
@@ -617,12 +545,8 @@ class TestClaudeClientEdgeCases:
     
     @patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'})
     @patch('git_squash.ai.claude.AsyncAnthropic')
-    @pytest.mark.asyncio
     async def test_malformed_response_handling(self, mock_anthropic_class):
         """Test handling of malformed responses."""
-        if not HAS_ANTHROPIC:
-            pytest.skip("anthropic library not installed")
-            
         # Response with dict-style content blocks
         mock_response = Mock()
         mock_response.content = [
@@ -630,9 +554,7 @@ class TestClaudeClientEdgeCases:
             {'type': 'not-text', 'data': 'ignored'}
         ]
         
-        mock_client = AsyncMock()
-        mock_client.messages.create = AsyncMock(return_value=mock_response)
-        mock_anthropic_class.return_value = mock_client
+        _wire_anthropic(mock_anthropic_class, response=mock_response)
         
         client = ClaudeClient()
         
@@ -655,17 +577,14 @@ class TestClaudeClientEdgeCases:
         assert len(summary) > 0
 
 
+@async_module_loop
 class TestClaudeClientIntegration:
     """Integration tests with mocked Anthropic client."""
     
     @patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'})
     @patch('git_squash.ai.claude.AsyncAnthropic')
-    @pytest.mark.asyncio
-    async def test_full_workflow(self, mock_anthropic_class):
+    async def test_full_workflow(self, mock_anthropic_class, auth_diff):
         """Test complete workflow from analysis to summary."""
-        if not HAS_ANTHROPIC:
-            pytest.skip("anthropic library not installed")
-            
         # Set up comprehensive test data
         categories = CommitCategories(
             features=[
@@ -715,39 +634,7 @@ class TestClaudeClientIntegration:
             "Optimize session lookup queries"
         ]
         
-        diff_content = """diff --git a/auth/models.py b/auth/models.py
-new file mode 100644
-index 0000000..1234567
---- /dev/null
-+++ b/auth/models.py
-@@ -0,0 +1,50 @@
-+from django.db import models
-+from django.contrib.auth.models import AbstractUser
-+import bcrypt
-+
-+class User(AbstractUser):
-+    '''Enhanced user model with OAuth support'''
-+    oauth_provider = models.CharField(max_length=50, blank=True)
-+    oauth_id = models.CharField(max_length=255, blank=True)
-+    
-+    def set_password(self, raw_password):
-+        # Use bcrypt for secure password hashing
-+        self.password = bcrypt.hashpw(
-+            raw_password.encode('utf-8'),
-+            bcrypt.gensalt()
-+        ).decode('utf-8')
-"""
-        
-        # Set up mock response with proper anthropic types
-        from anthropic.types import Message, TextBlock, Usage
-
-        mock_response = Message(
-            id="msg_test_123",
-            type="message",
-            role="assistant",
-            content=[
-                TextBlock(
-                    text="""<commit-message>
+        mock_response = make_message("""<commit-message>
 Implement secure authentication system with OAuth2 support
 
 - add comprehensive user authentication with bcrypt password hashing
@@ -760,22 +647,9 @@ Implement secure authentication system with OAuth2 support
 - docs: update API documentation with auth endpoints
 - performance: optimize session queries with proper indexing
 - note: Contains critical security fixes for SQL injection and weak hashing
-</commit-message>""",
-                    type="text"
-                )
-            ],
-            model="claude-3-5-sonnet-20241022",
-            stop_reason="end_turn",
-            usage=Usage(
-                input_tokens=200,
-                output_tokens=50,
-                total_tokens=250
-            )
-        )
+</commit-message>""", in_tok=200)
         
-        mock_client = AsyncMock()
-        mock_client.messages.create = AsyncMock(return_value=mock_response)
-        mock_anthropic_class.return_value = mock_client
+        mock_client = _wire_anthropic(mock_anthropic_class, response=mock_response)
         
         # Test summary generation
         client = ClaudeClient()
@@ -783,7 +657,7 @@ Implement secure authentication system with OAuth2 support
             date="2025-01-15",
             analysis=analysis,
             commit_subjects=commit_subjects,
-            diff_content=diff_content
+            diff_content=auth_diff
         )
         
         # Verify comprehensive summary
@@ -793,25 +667,11 @@ Implement secure authentication system with OAuth2 support
         assert "note: Contains critical security fixes" in summary
         
         # Test branch name suggestion
-        mock_branch_response = Message(
-            id="msg_test_456",
-            type="message",
-            role="assistant",
-            content=[
-                TextBlock(
-                    text="<branch-name>auth-security-fixes</branch-name>",
-                    type="text"
-                )
-            ],
-            model="claude-3-5-sonnet-20241022",
-            stop_reason="end_turn",
-            usage=Usage(
-                input_tokens=30,
-                output_tokens=10,
-                total_tokens=40
-            )
+        mock_branch_response = make_message(
+            "<branch-name>auth-security-fixes</branch-name>",
+            in_tok=30, out_tok=10
         )
-        mock_client.messages.create = AsyncMock(return_value=mock_branch_response)
+        mock_client.messages.response = mock_branch_response
         
         branch_name = await client.suggest_branch_name([summary])
         assert branch_name == "auth-security-fixes"
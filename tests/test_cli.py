@@ -1,48 +1,65 @@
 """Tests for CLI functionality."""
 
+from datetime import datetime
+from unittest.mock import Mock, patch, create_autospec
+
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
+
+from git_squash.ai.mock import MockAIClient
 from git_squash.cli import (
     create_argument_parser, validate_environment, create_ai_client,
-    display_plan, confirm_execution, main
+    display_plan, confirm_execution, main, _version_string
 )
 from git_squash.core.config import GitSquashConfig
-from git_squash.core.types import SquashPlanItem, CommitInfo
-from datetime import datetime
+from git_squash.core.types import SquashPlan, SquashPlanItem, CommitInfo
+from git_squash.git.operations import GitOperations
+from git_squash.tool import GitSquashTool
+
+
+@pytest.fixture(autouse=True)
+def fresh_argument_parser():
+    """Keep tests isolated from the memoized argument parser."""
+    create_argument_parser.cache_clear()
+    yield
+    create_argument_parser.cache_clear()
+
+
+ARGUMENT_PARSING_CASES = (
+    pytest.param([], {
+        'message_limit': 800,
+        'branch_prefix': "feature/",
+        'model': "claude-3-7-sonnet-20250219",
+        'dry_run': False,
+        'execute': False,
+        'test_mode': False,
+        'verbose': False,
+        'combine': False,
+    }, id="defaults"),
+    pytest.param(["--execute"], {'execute': True, 'dry_run': False}, id="execute"),
+    pytest.param(["--dry-run"], {'dry_run': True, 'execute': False}, id="dry-run"),
+    pytest.param(["--start-date", "2024-01-01", "--message-limit", "600"],
+                 {'start_date': "2024-01-01", 'message_limit': 600}, id="date-and-limit"),
+    pytest.param(["--test-mode"], {'test_mode': True}, id="test-mode"),
+    pytest.param(["--combine"], {'combine': True}, id="combine"),
+    pytest.param(["--combine", "--start-date", "2024-01-01", "--end-date", "2024-01-31"],
+                 {'combine': True, 'start_date': "2024-01-01", 'end_date': "2024-01-31"},
+                 id="combine-with-date-range"),
+    pytest.param(["--from", "2024-01-01", "--to", "2024-01-31"],
+                 {'start_date': "2024-01-01", 'end_date': "2024-01-31"}, id="date-aliases"),
+)
 
 
 class TestArgumentParser:
     """Test CLI argument parsing."""
     
-    def test_default_arguments(self):
-        """Test default argument values."""
-        parser = create_argument_parser()
-        args = parser.parse_args([])
-        
-        assert args.message_limit == 800
-        assert args.branch_prefix == "feature/"
-        assert args.model == "claude-3-7-sonnet-20250219"
-        assert args.dry_run is False
-        assert args.execute is False
-        assert args.test_mode is False
-        assert args.verbose is False
-        assert args.combine is False
-    
-    def test_execute_argument(self):
-        """Test --execute argument."""
-        parser = create_argument_parser()
-        args = parser.parse_args(["--execute"])
-        
-        assert args.execute is True
-        assert args.dry_run is False
-    
-    def test_dry_run_argument(self):
-        """Test --dry-run argument."""
-        parser = create_argument_parser()
-        args = parser.parse_args(["--dry-run"])
-        
-        assert args.dry_run is True
-        assert args.execute is False
+    @pytest.mark.parametrize("argv,expected", ARGUMENT_PARSING_CASES)
+    def test_argument_parsing(self, argv, expected):
+        """Test parsed values for each argument combination."""
+        args = create_argument_parser().parse_args(argv)
+        
+        for name, value in expected.items():
+            actual = getattr(args, name)
+            assert actual == value and type(actual) is type(value), name
     
     def test_mutually_exclusive_execution(self):
         """Test that --execute and --dry-run are mutually exclusive."""
@@ -50,55 +67,6 @@ class TestArgumentParser:
         
         with pytest.raises(SystemExit):
             parser.parse_args(["--execute", "--dry-run"])
-    
-    def test_date_and_limit_arguments(self):
-        """Test date and limit arguments."""
-        parser = create_argument_parser()
-        args = parser.parse_args([
-            "--start-date", "2024-01-01",
-            "--message-limit", "600"
-        ])
-        
-        assert args.start_date == "2024-01-01"
-        assert args.message_limit == 600
-    
-    def test_test_mode_argument(self):
-        """Test --test-mode argument."""
-        parser = create_argument_parser()
-        args = parser.parse_args(["--test-mode"])
-        
-        assert args.test_mode is True
-
-    def test_combine_argument(self):
-        """Test --combine argument."""
-        parser = create_argument_parser()
-        args = parser.parse_args(["--combine"])
-
-        assert args.combine is True
-
-    def test_combine_with_date_range(self):
-        """Test --combine with date range arguments."""
-        parser = create_argument_parser()
-        args = parser.parse_args([
-            "--combine",
-            "--start-date", "2024-01-01",
-            "--end-date", "2024-01-31"
-        ])
-
-        assert args.combine is True
-        assert args.start_date == "2024-01-01"
-        assert args.end_date == "2024-01-31"
-
-    def test_date_aliases(self):
-        """Test --from and --to aliases for date arguments."""
-        parser = create_argument_parser()
-        args = parser.parse_args([
-            "--from", "2024-01-01",
-            "--to", "2024-01-31"
-        ])
-
-        assert args.start_date == "2024-01-01"
-        assert args.end_date == "2024-01-31"
 
 
 class TestEnvironmentValidation:
@@ -122,206 +90,169 @@ class TestEnvironmentValidation:
             validate_environment(use_test_mode=False)
 
 
+@pytest.fixture(scope="module")
+def default_config():
+    """Default configuration; create_ai_client does not mutate it."""
+    return GitSquashConfig()
+
+
 class TestAIClientCreation:
     """Test AI client creation."""
     
-    def test_create_mock_client(self):
+    def test_create_mock_client(self, default_config):
         """Test creating mock AI client."""
         args = Mock()
         args.test_mode = True
-        config = GitSquashConfig()
         
-        client = create_ai_client(args, config)
+        client = create_ai_client(args, default_config)
         
-        from git_squash.ai.mock import MockAIClient
         assert isinstance(client, MockAIClient)
     
     @patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'})
-    @patch('git_squash.cli.ClaudeClient')
-    def test_create_claude_client(self, mock_claude_class):
+    @patch('git_squash.ai.claude.ClaudeClient')
+    def test_create_claude_client(self, mock_claude_class, default_config):
         """Test creating Claude AI client."""
         args = Mock()
         args.test_mode = False
-        config = GitSquashConfig()
         
         mock_instance = Mock()
         mock_claude_class.return_value = mock_instance
         
-        client = create_ai_client(args, config)
+        client = create_ai_client(args, default_config)
         
-        mock_claude_class.assert_called_once_with(config=config, cache_dir=None)
+        mock_claude_class.assert_called_once_with(config=default_config, cache_dir=None)
         assert client == mock_instance
 
 
+_FIXED_DT = datetime(2024, 1, 1, 10, 0, 0)
+_FIXED_COMMIT = CommitInfo(
+    hash="abc123def456",
+    date="2024-01-01T10:00:00",
+    subject="Test commit",
+    author_name="Test User",
+    author_email="test@example.com",
+    datetime=_FIXED_DT
+)
+
+DISPLAY_PLAN_EXPECTED = ("SQUASH PLAN", "2024-01-01: 1 commits", "abc123de..abc123de", "Test summary")
+
+
 class TestPlanDisplay:
     """Test plan display functionality."""
     
     def test_display_plan(self, capsys):
         """Test plan display output."""
         # Create mock plan
-        commit = CommitInfo(
-            hash="abc123def456",
-            date="2024-01-01T10:00:00",
-            subject="Test commit",
-            author_name="Test User",
-            author_email="test@example.com",
-            datetime=datetime(2024, 1, 1, 10, 0, 0)
-        )
-        
         item = SquashPlanItem(
             date="2024-01-01",
-            commits=[commit],
+            commits=[_FIXED_COMMIT],
             summary="Test summary\n\nThis is a test commit summary"
         )
         
-        plan = Mock()
+        plan = create_autospec(SquashPlan, instance=True)
         plan.items = [item]
         plan.summary_stats.return_value = "1 commit → 1 squashed commit"
         
         display_plan(plan)
         
-        captured = capsys.readouterr()
-        assert "SQUASH PLAN" in captured.out
-        assert "2024-01-01: 1 commits" in captured.out
-        assert "abc123de..abc123de" in captured.out
-        assert "Test summary" in captured.out
+        out = capsys.readouterr().out
+        missing = [s for s in DISPLAY_PLAN_EXPECTED if s not in out]
+        assert not missing, f"missing: {missing}"
+
+
+def _stub_input(*answers):
+    """Return an input() replacement that yields the given answers in order."""
+    it = iter(answers)
+    return lambda prompt='': next(it)
 
 
 class TestConfirmExecution:
     """Test execution confirmation."""
     
-    @patch('builtins.input', return_value='y')
-    def test_confirm_yes(self, mock_input):
+    def test_confirm_yes(self, monkeypatch):
         """Test confirmation with 'y' response."""
-        result = confirm_execution()
-        assert result is True
+        monkeypatch.setattr('builtins.input', _stub_input('y'))
+        assert confirm_execution() is True
     
-    @patch('builtins.input', return_value='yes')
-    def test_confirm_yes_full(self, mock_input):
+    def test_confirm_yes_full(self, monkeypatch):
         """Test confirmation with 'yes' response."""
-        result = confirm_execution()
-        assert result is True
+        monkeypatch.setattr('builtins.input', _stub_input('yes'))
+        assert confirm_execution() is True
     
-    @patch('builtins.input', return_value='n')
-    def test_confirm_no(self, mock_input):
+    def test_confirm_no(self, monkeypatch):
         """Test confirmation with 'n' response."""
-        result = confirm_execution()
-        assert result is False
+        monkeypatch.setattr('builtins.input', _stub_input('n'))
+        assert confirm_execution() is False
     
-    @patch('builtins.input', return_value='no')
-    def test_confirm_no_full(self, mock_input):
+    def test_confirm_no_full(self, monkeypatch):
         """Test confirmation with 'no' response."""
-        result = confirm_execution()
-        assert result is False
+        monkeypatch.setattr('builtins.input', _stub_input('no'))
+        assert confirm_execution() is False
     
-    @patch('builtins.input', side_effect=['invalid', 'y'])
-    def test_confirm_retry(self, mock_input):
+    def test_confirm_retry(self, monkeypatch):
         """Test confirmation retry on invalid input."""
-        result = confirm_execution()
-        assert result is True
+        monkeypatch.setattr('builtins.input', _stub_input('invalid', 'y'))
+        assert confirm_execution() is True
+
+
+@pytest.fixture(scope="module")
+def mock_plan():
+    """Empty squash plan shared by the main() tests."""
+    plan = create_autospec(SquashPlan, instance=True)
+    plan.items = []
+    plan.summary_stats.return_value = "0 commits → 0 squashed commits"
+    return plan
+
+
+@pytest.fixture
+def mock_tool(monkeypatch, mock_plan):
+    """Patch main()'s collaborators and return the mocked GitSquashTool instance."""
+    tool_class = create_autospec(GitSquashTool)
+    tool = tool_class.return_value
+    tool.prepare_squash_plan.return_value = mock_plan
+    tool.suggest_branch_name.return_value = "feature/test"
+    
+    ai_client = Mock()
+    ai_client.get_usage_stats.return_value = {
+        'cache_hits': 0,
+        'cache_misses': 0,
+        'total_requests': 0
+    }
+    
+    monkeypatch.setattr('git_squash.cli.GitOperations', create_autospec(GitOperations))
+    monkeypatch.setattr('git_squash.cli.GitSquashTool', tool_class)
+    monkeypatch.setattr('git_squash.cli.create_ai_client', Mock(return_value=ai_client))
+    monkeypatch.setattr('git_squash.cli.validate_environment', Mock())
+    return tool
 
 
 class TestMainFunction:
     """Test main CLI function."""
     
-    @patch('git_squash.cli.GitOperations')
-    @patch('git_squash.cli.create_ai_client')
-    @patch('git_squash.cli.GitSquashTool')
-    @patch('git_squash.cli.validate_environment')
-    def test_main_dry_run(self, mock_validate, mock_tool_class, mock_create_ai, mock_git_ops_class):
-        """Test main function in dry run mode."""
-        # Set up mocks
-        mock_git_ops = Mock()
-        mock_git_ops_class.return_value = mock_git_ops
-        
-        mock_ai_client = Mock()
-        mock_ai_client.get_usage_stats.return_value = {
-            'cache_hits': 0,
-            'cache_misses': 0,
-            'total_requests': 0
-        }
-        mock_create_ai.return_value = mock_ai_client
-        
-        mock_tool = Mock()
-        mock_tool_class.return_value = mock_tool
-        
-        # Create mock plan
-        mock_plan = Mock()
-        mock_plan.items = []
-        mock_plan.summary_stats.return_value = "0 commits → 0 squashed commits"
-        
-        # Make prepare_squash_plan async
-        mock_tool.prepare_squash_plan = AsyncMock(return_value=mock_plan)
-        
-        # Run main
-        result = main(['--dry-run'])
-        
-        assert result == 0
-        mock_validate.assert_called_once()
-        mock_tool.prepare_squash_plan.assert_called_once()
+    def test_fast_version_path(self, monkeypatch, capsys):
+        """Test --version is answered without building the argument parser."""
+        def fail():
+            raise AssertionError("argument parser should not be built")
+        monkeypatch.setattr('git_squash.cli.create_argument_parser', fail)
+        
+        assert main(['--version']) == 0
+        assert capsys.readouterr().out.strip() == _version_string()
     
-    @patch('git_squash.cli.GitOperations')
-    @patch('git_squash.cli.create_ai_client')
-    @patch('git_squash.cli.GitSquashTool')
-    @patch('git_squash.cli.validate_environment')
-    @patch('git_squash.cli.confirm_execution', return_value=True)
-    def test_main_execute(self, mock_confirm, mock_validate, mock_tool_class, mock_create_ai, mock_git_ops_class):
-        """Test main function in execute mode."""
-        # Set up mocks
-        mock_git_ops = Mock()
-        mock_git_ops_class.return_value = mock_git_ops
-        
-        mock_ai_client = Mock()
-        mock_create_ai.return_value = mock_ai_client
-        
-        mock_tool = Mock()
-        mock_tool_class.return_value = mock_tool
-        
-        # Create mock plan
-        mock_plan = Mock()
-        mock_plan.items = []
-        mock_plan.summary_stats.return_value = "0 commits → 0 squashed commits"
-        
-        # Make async methods
-        mock_tool.prepare_squash_plan = AsyncMock(return_value=mock_plan)
-        mock_tool.suggest_branch_name = AsyncMock(return_value="feature/test")
-        
-        # Run main
-        result = main(['--execute'])
+    @pytest.mark.parametrize("argv,confirm,expect_exec", [
+        pytest.param(['--dry-run'], None, False, id="dry-run"),
+        pytest.param(['--execute'], True, True, id="execute"),
+        pytest.param(['--execute'], False, False, id="execute-aborted"),
+    ])
+    def test_main(self, mock_tool, monkeypatch, argv, confirm, expect_exec):
+        """Test main function across dry-run, execute and aborted execute."""
+        if confirm is not None:
+            monkeypatch.setattr('git_squash.cli.confirm_execution', lambda: confirm)
+        
+        result = main(argv)
         
         assert result == 0
-        mock_tool.execute_squash_plan.assert_called_once()
-    
-    @patch('git_squash.cli.GitOperations')
-    @patch('git_squash.cli.create_ai_client') 
-    @patch('git_squash.cli.GitSquashTool')
-    @patch('git_squash.cli.validate_environment')
-    @patch('git_squash.cli.confirm_execution', return_value=False)
-    def test_main_execute_aborted(self, mock_confirm, mock_validate, mock_tool_class, mock_create_ai, mock_git_ops_class):
-        """Test main function when execution is aborted."""
-        # Set up mocks
-        mock_git_ops = Mock()
-        mock_git_ops_class.return_value = mock_git_ops
-        
-        mock_ai_client = Mock()
-        mock_create_ai.return_value = mock_ai_client
-        
-        mock_tool = Mock()
-        mock_tool_class.return_value = mock_tool
-        
-        # Create mock plan
-        mock_plan = Mock()
-        mock_plan.items = []
-        mock_plan.summary_stats.return_value = "0 commits → 0 squashed commits"
-        
-        # Make prepare_squash_plan async
-        mock_tool.prepare_squash_plan = AsyncMock(return_value=mock_plan)
-        
-        # Run main
-        result = main(['--execute'])
-        
-        assert result == 0
-        mock_tool.execute_squash_plan.assert_not_called()
+        mock_tool.prepare_squash_plan.assert_called_once()
+        assert mock_tool.execute_squash_plan.called is expect_exec
 
 
 if __name__ == "__main__":
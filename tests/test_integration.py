@@ -5,16 +5,24 @@ This combines the best of test_integration.py and test_integration_v2.py:
 - Explicit merge testing and verification (from v1)
 - Both abstracted and direct git operations
 - Comprehensive date filtering and combine flag tests
+
+Test repositories are created under $GIT_SQUASH_TEST_TMPDIR when set,
+otherwise under /dev/shm when writable, otherwise in the default temp dir.
 """
 
+import asyncio
+import hashlib
 import pytest
-import tempfile
+import shutil
 import subprocess
 import os
+import tempfile
+from collections import deque
 from pathlib import Path
-from datetime import date, timedelta
-from typing import List, Optional, Dict, Self, Sequence, Tuple
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional, Dict, Self, Sequence, Tuple
 from dataclasses import dataclass
+from functools import cache, cached_property
 from enum import Enum
 from git_squash import (
     GitSquashConfig, GitSquashTool,
@@ -22,6 +30,11 @@ from git_squash import (
 )
 
 
+# Resolved once so scenario dates and the tests' date filters always agree,
+# even when cached scenario templates outlive midnight
+TODAY = date.today()
+
+
 class Version(Enum):
     """Content versions."""
     V1 = 1
@@ -62,6 +75,18 @@ LOREM_CONTENT = {
     ),
 }
 
+# Pre-encoded content so writes and verifications skip per-call UTF-8 encoding
+LOREM_BYTES = {version: content.encode("utf-8") for version, content in LOREM_CONTENT.items()}
+
+# Lines each version adds up to V3, checked together against squashed file content
+V3_MARKERS = ("Lorem ipsum dolor sit amet.", "Consectetur adipiscing elit", "Tempor incididunt")
+
+# Blob ids git assigns to each version (init_repo pins the SHA-1 object format)
+LOREM_BLOB_IDS = {
+    version: hashlib.sha1(b"blob %d\0%s" % (len(content), content)).hexdigest()
+    for version, content in LOREM_BYTES.items()
+}
+
 
 @dataclass
 class FileChange:
@@ -71,9 +96,9 @@ class FileChange:
     message: Optional[str] = None
     days_ago: Optional[int] = None  # Relative date specification
 
-    def get_content(self) -> str:
-        """Get the content for this version."""
-        return LOREM_CONTENT[self.version]
+    def get_content(self) -> bytes:
+        """Get the encoded content for this version."""
+        return LOREM_BYTES[self.version]
 
     def get_message(self) -> str:
         """Get commit message."""
@@ -87,17 +112,34 @@ class FileChange:
         """Get commit date as ISO string."""
         if self.days_ago is None:
             return None
-        base = base_date or date.today()
+        base = base_date or TODAY
         commit_date = base - timedelta(days=self.days_ago)
         return f"{commit_date}T10:00:00"
 
 
+@dataclass
+class Scenario:
+    """A named, ordered list of commits, each grouping one or more file changes."""
+    name: str
+    commits: List[List[FileChange]]
+
+    @cached_property
+    def changes(self) -> List[FileChange]:
+        """All file changes in commit order."""
+        return [change for commit in self.commits for change in commit]
+
+    @cached_property
+    def final_versions(self) -> Dict[str, Version]:
+        """Final version of each path (the last change to it wins), computed once."""
+        return {change.path: change.version for change in self.changes}
+
+
 def create_daily_scenario(
     name: str,
     days: int,
     files_per_day: int = 2,
     updates_per_day: int = 1
-) -> List[FileChange]:
+) -> Scenario:
     """Create a scenario with daily commits over specified days.
 
     Args:
@@ -107,31 +149,28 @@ def create_daily_scenario(
         updates_per_day: Number of file updates each day
 
     Returns:
-        List of file changes
+        Scenario with the generated changes
     """
     builder = ScenarioBuilder(name)
-    all_files = []
+    # Files from previous days, least recently updated first
+    eligible = deque()
 
     for day in range(days - 1, -1, -1):  # Start from oldest day
         builder.days_ago(day)
 
         # Add new files for this day
-        day_files = []
-        for i in range(files_per_day):
-            file_path = f"src/day{days-day}/file{i+1}.js"
+        day_files = [f"src/day{days-day}/file{i+1}.js" for i in range(files_per_day)]
+        for file_path in day_files:
             builder.add(file_path)
-            day_files.append(file_path)
-            all_files.append(file_path)
-
-        # Update some existing files
-        if all_files and updates_per_day > 0:
-            # Pick files to update (from previous days)
-            files_to_update = [
-                f for f in all_files if f not in day_files][:updates_per_day]
-            for file_path in files_to_update:
-                current_version = builder.file_versions[file_path]
-                next_version = Version(min(current_version.value + 1, 5))
-                builder.update(file_path, next_version)
+
+        # Update existing files round-robin, rotating each to the back
+        for _ in range(min(updates_per_day, len(eligible))):
+            file_path = eligible.popleft()
+            next_version = Version(min(builder.file_versions[file_path].value + 1, 5))
+            builder.update(file_path, next_version)
+            eligible.append(file_path)
+
+        eligible.extend(day_files)
 
     return builder.build()
 
@@ -141,7 +180,7 @@ class ScenarioBuilder:
 
     def __init__(self, name: str):
         self.name = name
-        self.changes: List[FileChange] = []
+        self.commits: List[List[FileChange]] = []
         self.file_versions: Dict[str, Version] = {}
         # Track current date context
         self.current_days_ago: Optional[int] = None
@@ -163,37 +202,40 @@ class ScenarioBuilder:
         """Set context to n days ago."""
         return self.on_day(n)
 
+    def _change(self, path: str, version: Version, message: Optional[str]) -> FileChange:
+        """Record a file change in the current date context."""
+        if version != Version.V1 and path not in self.file_versions:
+            raise ValueError(f"File {path} not found. Add it first.")
+        self.file_versions[path] = version
+        return FileChange(path, version, message, self.current_days_ago)
+
     def add(self, path: str, message: Optional[str] = None) -> Self:
         """Add a new file."""
-        self.changes.append(FileChange(
-            path, Version.V1, message, self.current_days_ago))
-        self.file_versions[path] = Version.V1
+        self.commits.append([self._change(path, Version.V1, message)])
         return self
 
     def update(self, path: str, version: Version, message: Optional[str] = None) -> Self:
-        """Update file to new version."""
-        if path not in self.file_versions:
-            raise ValueError(f"File {path} not found. Add it first.")
-        self.changes.append(FileChange(
-            path, version, message, self.current_days_ago))
-        self.file_versions[path] = version
+        """Update file to new version.
+
+        Changes are applied in order, so the last one recorded for a path
+        defines its final content (see Scenario.final_versions).
+        """
+        self.commits.append([self._change(path, version, message)])
         return self
 
     def add_many(self, *paths: str, message: Optional[str] = None) -> Self:
         """Add multiple files in one commit."""
-        for path in paths:
-            self.add(path, message)
+        self.commits.append([self._change(path, Version.V1, message) for path in paths])
         return self
 
     def update_many(self, *updates: Tuple[str, Version], message: Optional[str] = None) -> Self:
         """Update multiple files in one commit."""
-        for path, version in updates:
-            self.update(path, version, message)
+        self.commits.append([self._change(path, version, message) for path, version in updates])
         return self
 
-    def build(self) -> List[FileChange]:
-        """Build the list of changes."""
-        return self.changes
+    def build(self) -> Scenario:
+        """Build the scenario."""
+        return Scenario(self.name, self.commits)
 
 
 class GitTestRepository:
@@ -202,91 +244,246 @@ class GitTestRepository:
     def __init__(self, repo_path: Path):
         self.repo_path = repo_path
         self.repo_path.mkdir(exist_ok=True)
+        # Snapshot once; never block on a prompt or take optional index locks.
+        self._base_env = {**os.environ, 'GIT_TERMINAL_PROMPT': '0', 'GIT_OPTIONAL_LOCKS': '0'}
+        # Long-lived `git cat-file --batch-command` serving read-only queries
+        self._cat_file: Optional[subprocess.Popen] = None
+
+    def close(self):
+        """Stop the cat-file helper, if it was started."""
+        if self._cat_file is not None:
+            self._cat_file.stdin.close()
+            self._cat_file.wait()
+            self._cat_file.stdout.close()
+            self._cat_file = None
+
+    def _query_object(self, command: str, name: str) -> Optional[Tuple[str, str, bytes]]:
+        """Run an info/contents query; return (oid, type, contents) or None if missing.
+
+        Refs and objects written by other git processes are seen on each query.
+        """
+        if self._cat_file is None:
+            self._cat_file = subprocess.Popen(
+                ["git", "cat-file", "--batch-command"],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                env=self._base_env
+            )
+        proc = self._cat_file
+        proc.stdin.write(f"{command} {name}\n".encode())
+        proc.stdin.flush()
+        header = proc.stdout.readline().split()
+        if header[-1] in (b"missing", b"ambiguous"):
+            return None
+        oid, obj_type, size = header[0].decode(), header[1].decode(), int(header[2])
+        contents = proc.stdout.read(size + 1)[:-1] if command == "contents" else b""
+        return oid, obj_type, contents
+
+    def run_git(self, *args, env=None, check=True, capture=False):
+        """Execute a git command.
 
-    def run_git(self, *args, env=None, check=True):
-        """Execute a git command."""
+        stdout is only captured with capture=True, as bytes for the caller
+        to decode if it needs text; stderr is always kept for error reports.
+        """
         cmd = ["git"] + list(args)
-        result = subprocess.run(
+        if capture:
+            return subprocess.run(
+                cmd,
+                cwd=self.repo_path,
+                capture_output=True,
+                check=check,
+                env=env or self._base_env
+            )
+        # With a single pipe communicate() reads stderr directly, no selector loop
+        with subprocess.Popen(
             cmd,
             cwd=self.repo_path,
-            capture_output=True,
-            text=True,
-            check=check,
-            env=env or os.environ
-        )
-        return result
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            env=env or self._base_env
+        ) as proc:
+            _, stderr = proc.communicate()
+        if check and proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, None, stderr)
+        return subprocess.CompletedProcess(cmd, proc.returncode, None, stderr)
 
     def init_repo(self, initial_branch="main"):
-        """Initialize repository."""
-        self.run_git("init")
-        self.run_git("config", "user.name", "Test User")
-        self.run_git("config", "user.email", "test@example.com")
-        self.run_git("branch", "-m", initial_branch)
+        """Initialize repository (the suite needs git >= 2.36, see _MIN_GIT_VERSION)."""
+        # Pin SHA-1 so LOREM_BLOB_IDS hold whatever GIT_DEFAULT_HASH says
+        self.run_git("init", "-b", initial_branch, "--object-format=sha1")
+        # Append the config directly rather than spawning git config per key.
+        # These repositories are throwaway: skip fsync (git >= 2.36) and
+        # auto gc, and never sign or convert line endings whatever the
+        # user's global config says.
+        with open(self.repo_path / ".git" / "config", "a") as f:
+            f.write("[user]\n\tname = Test User\n\temail = test@example.com\n"
+                    "[core]\n\tfsync = none\n\tautocrlf = false\n"
+                    "[gc]\n\tauto = 0\n"
+                    "[commit]\n\tgpgsign = false\n")
 
     def create_initial_commit(self):
         """Create initial commit."""
-        (self.repo_path / "README.md").write_text("# Test Repository\n")
-        self.run_git("add", "README.md")
-        self.run_git("commit", "-m", "Initial commit")
+        self._fast_import([
+            (datetime.now().astimezone(), "Initial commit", [("README.md", b"# Test Repository\n")])
+        ])
+
+    def switch_branch(self, branch_name: str, create: bool = True, fast: bool = False):
+        """Switch to branch.
 
-    def switch_branch(self, branch_name: str, create: bool = True):
-        """Switch to branch."""
-        if create:
+        With fast=True a new branch is created by writing the ref files
+        directly; only use it when the working tree is clean.
+        """
+        if create and fast:
+            self._fast_branch_create(branch_name)
+        elif create:
             self.run_git("checkout", "-b", branch_name)
         else:
             self.run_git("checkout", branch_name)
 
-    def apply_change(self, change: FileChange, commit_date: Optional[str] = None):
-        """Apply a single file change."""
-        file_path = self.repo_path / change.path
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(change.get_content())
-        self.run_git("add", change.path)
+    def load_template(self, template: "GitTestRepository", branch_name: str):
+        """Replace this repository with a copy of template's, renaming its branch.
+
+        The template's checked-out branch must be a loose ref (as fast_import
+        and _fast_branch_create leave it).
+        """
+        self.close()
+        shutil.rmtree(self.repo_path)
+        shutil.copytree(template.repo_path, self.repo_path)
+        template_ref, _ = self._resolve_head()
+        self._fast_branch_create(branch_name)
+        (self.repo_path / ".git" / template_ref).unlink()
 
-        env = None
-        if commit_date:
-            env = os.environ.copy()
-            env['GIT_AUTHOR_DATE'] = commit_date
-            env['GIT_COMMITTER_DATE'] = commit_date
+    def _resolve_head(self) -> Tuple[Optional[str], Optional[str]]:
+        """Return (symbolic ref or None if detached, commit sha or None if unborn) for HEAD.
 
-        self.run_git("commit", "-m", change.get_message(), env=env)
+        Reads the loose ref files directly and only spawns git for packed refs.
+        """
+        git_dir = self.repo_path / ".git"
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return None, head
+        ref = head[len("ref: "):]
+        ref_file = git_dir / ref
+        if ref_file.exists():
+            return ref, ref_file.read_text().strip()
+        sha = self.run_git("rev-parse", "-q", "--verify", "HEAD", check=False, capture=True).stdout.strip()
+        return ref, sha.decode() or None
+
+    def _fast_branch_create(self, branch_name: str):
+        """Point a new branch at HEAD and check it out without spawning git."""
+        git_dir = self.repo_path / ".git"
+        _, sha = self._resolve_head()
+        if sha is None:
+            raise ValueError("Cannot branch from an unborn HEAD")
+
+        new_ref = git_dir / "refs" / "heads" / branch_name
+        new_ref.parent.mkdir(parents=True, exist_ok=True)
+        with open(new_ref, "x") as f:
+            f.write(sha + "\n")
+        (git_dir / "HEAD").write_text(f"ref: refs/heads/{branch_name}\n")
+
+    def fast_import(self, commits: Sequence[Sequence[FileChange]], base_date: Optional[date] = None):
+        """Create commits on the current branch through one git fast-import stream.
+
+        Each group of changes becomes one commit, with message and date taken
+        from its first change. The index and working tree are synced to the new
+        HEAD afterwards.
+        """
+        records = []
+        for changes in commits:
+            first = changes[0]
+            commit_date = first.get_commit_date(base_date)
+            when = (datetime.fromisoformat(commit_date) if commit_date else datetime.now()).astimezone()
+            files = [(change.path, change.get_content()) for change in changes]
+            records.append((when, first.get_message(), files))
+        self._fast_import(records)
+
+    def _fast_import(self, records: Sequence[Tuple[datetime, str, Sequence[Tuple[str, bytes]]]]):
+        """Feed (timestamp, message, [(path, content)]) commits to one git fast-import.
+
+        Commits go on top of the checked-out branch, which may still be unborn.
+        """
+        branch, parent = self._resolve_head()
+        if branch is None:
+            raise ValueError("fast_import needs a branch checked out, not a detached HEAD")
+
+        stream = bytearray()
+        for i, (when, message, files) in enumerate(records):
+            ident = f"Test User <test@example.com> {int(when.timestamp())} {when:%z}"
+            data = (message + "\n").encode()
+
+            stream += f"commit {branch}\nauthor {ident}\ncommitter {ident}\n".encode()
+            stream += b"data %d\n%s\n" % (len(data), data)
+            if i == 0 and parent:
+                stream += f"from {parent}\n".encode()
+            for path, content in files:
+                stream += f"M 100644 inline {path}\ndata {len(content)}\n".encode()
+                stream += content + b"\n"
+
+        subprocess.run(
+            ["git", "fast-import", "--quiet", "--date-format=raw"],
+            cwd=self.repo_path,
+            input=bytes(stream),
+            env=self._base_env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            check=True
+        )
+        self.run_git("reset", "--hard", "--quiet")
 
     def get_commit_count(self, revision_range: Optional[str] = None) -> int:
-        """Get commit count."""
-        args = ["log", "--oneline"]
-        if revision_range:
-            args.append(revision_range)
-        result = self.run_git(*args)
-        return len(result.stdout.strip().split('\n')) if result.stdout.strip() else 0
+        """Get commit count for a rev or a "base..tip" range."""
+        result = self.run_git("rev-list", "--count", revision_range or "HEAD", capture=True)
+        return int(result.stdout)
 
     def merge_branch(self, branch_name: str, message: str):
         """Merge a branch."""
         return self.run_git("merge", "--no-ff", branch_name, "-m", message)
 
-    def verify_file(self, path: str, version: Version) -> bool:
-        """Verify file has expected content."""
-        file_path = self.repo_path / path
-        if not file_path.exists():
-            return False
-        return file_path.read_text() == LOREM_CONTENT[version]
+    def assert_tree_matches(self, expected: Dict[str, str], rev: str = "HEAD"):
+        """Assert each path in rev has the expected blob id."""
+        mismatched = []
+        for path, blob in expected.items():
+            info = self._query_object("info", f"{rev}:{path}")
+            if info is None or info[0] != blob:
+                mismatched.append(path)
+        mismatched.sort()
+        assert not mismatched, f"Files not at expected content in {rev}: {mismatched}"
 
     def get_file_content(self, path: str) -> str:
         """Get file content."""
         return (self.repo_path / path).read_text()
 
-    def get_log_graph(self) -> str:
-        """Get git log with graph."""
-        result = self.run_git("log", "--oneline", "--graph", "--no-decorate")
-        return result.stdout
+    def get_commit_subjects(self, count: int, rev: str = "HEAD") -> List[str]:
+        """Subjects of up to count commits along rev's first-parent chain, newest first."""
+        subjects = []
+        name = rev
+        while name and len(subjects) < count:
+            header, _, message = self._query_object("contents", name)[2].partition(b"\n\n")
+            subjects.append(message.partition(b"\n")[0].decode())
+            name = next((line[len(b"parent "):].decode() for line in header.split(b"\n")
+                         if line.startswith(b"parent ")), None)
+        return subjects
 
     def file_exists(self, path: str) -> bool:
         """Check if file exists."""
         return (self.repo_path / path).exists()
 
+    def count_tracked_files(self) -> int:
+        """Count working tree files without descending into .git."""
+        count = 0
+        for _, dirs, files in os.walk(self.repo_path):
+            if ".git" in dirs:
+                dirs.remove(".git")
+            count += len(files)
+        return count
 
-# Test scenarios
-SCENARIOS = {
-    "simple_feature": (
+
+# Test scenarios, built on first use so collection stays cheap
+_SCENARIO_FACTORIES: Dict[str, Callable[[], Scenario]] = {
+    "simple_feature": lambda: (
         ScenarioBuilder("Simple Feature")
         .add("src/main.js")
         .update("src/main.js", Version.V2)
@@ -296,7 +493,7 @@ SCENARIOS = {
         .build()
     ),
 
-    "multi_file_commits": (
+    "multi_file_commits": lambda: (
         ScenarioBuilder("Multi-file Commits")
         .add_many("src/app.js", "src/utils.js", "src/config.js",
                   message="Initial implementation")
@@ -315,7 +512,7 @@ SCENARIOS = {
         .build()
     ),
 
-    "three_day_development": (
+    "three_day_development": lambda: (
         ScenarioBuilder("Three Day Development")
         # Day 1 - 2 days ago
         .days_ago(2)
@@ -336,7 +533,7 @@ SCENARIOS = {
         .build()
     ),
 
-    "multi_day_feature": (
+    "multi_day_feature": lambda: (
         ScenarioBuilder("Feature Across Days")
         # Start 3 days ago
         .days_ago(3)
@@ -357,8 +554,25 @@ SCENARIOS = {
         .build()
     ),
 
+    "multi_day_incremental": lambda: (
+        ScenarioBuilder("Multi-day Incremental")
+        # Day 1 commits
+        .days_ago(2)
+        .add("src/app.js", "Add initial app.js file")
+        .update("src/app.js", Version.V2, "Add world to app.js")
+        # Day 2 commits
+        .days_ago(1)
+        .add("src/utils.js", "Add utility functions")
+        .update("src/app.js", Version.V3, "Add greet function")
+        # Day 3 commits (today)
+        .today()
+        .add("CHANGELOG.md", "Add changelog")
+        .add("package.json", "Add package.json")
+        .build()
+    ),
+
     # Real-world scenario similar to test_integration.py
-    "real_world_dev": (
+    "real_world_dev": lambda: (
         ScenarioBuilder("Real World Development")
         .add("app.js", "Add initial app.js file")
         .update("app.js", Version.V2, "Add world to app.js")
@@ -369,73 +583,119 @@ SCENARIOS = {
 }
 
 
-def apply_scenario(repo: GitTestRepository, changes: List[FileChange],
+@cache
+def get_scenario(name: str) -> Scenario:
+    """Build (once) and return the named scenario."""
+    return _SCENARIO_FACTORIES[name]()
+
+
+def apply_scenario(repo: GitTestRepository, scenario: Scenario,
                    base_date: Optional[date] = None):
     """Apply a scenario to repository."""
-    for change in changes:
-        commit_date = change.get_commit_date(base_date)
-        repo.apply_change(change, commit_date)
-
-
-def verify_final_state(repo: GitTestRepository, changes: List[FileChange]):
-    """Verify all files are in their final state."""
-    # Group by path to get final version (highest version number)
-    final_versions = {}
-    for change in changes:
-        if change.path not in final_versions:
-            final_versions[change.path] = change.version
-        else:
-            # Keep the higher version number
-            if change.version.value > final_versions[change.path].value:
-                final_versions[change.path] = change.version
+    if scenario.commits:
+        repo.fast_import(scenario.commits, base_date)
+
+
+def verify_final_state(repo: GitTestRepository, final_versions: Dict[str, Version]):
+    """Verify all files are at the given versions (e.g. Scenario.final_versions)."""
+    repo.assert_tree_matches(
+        {path: LOREM_BLOB_IDS[version] for path, version in final_versions.items()})
+
+
+# Keep throwaway repositories in memory when a writable tmpfs is available
+_TMP_ROOT = os.environ.get("GIT_SQUASH_TEST_TMPDIR") or (
+    "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None)
+
+# cat-file --batch-command and core.fsync=none both arrived in git 2.36
+_MIN_GIT_VERSION = (2, 36)
+
+
+def _git_version() -> Tuple[int, ...]:
+    """Installed git's (major, minor), or (0,) if git is not available."""
+    try:
+        out = subprocess.run(["git", "--version"], capture_output=True, text=True).stdout
+    except FileNotFoundError:
+        return (0,)
+    return tuple(int(part) for part in out.split()[2].split(".")[:2])
+
+
+pytestmark = pytest.mark.skipif(
+    _git_version() < _MIN_GIT_VERSION,
+    reason="integration tests need git >= %d.%d" % _MIN_GIT_VERSION)
 
-    # Verify each file
-    for path, version in final_versions.items():
-        assert repo.verify_file(
-            path, version), f"File {path} not at version {version}"
+
+@pytest.fixture(scope="session")
+def repo_root():
+    """Session scratch directory for test repositories, on tmpfs when available."""
+    with tempfile.TemporaryDirectory(prefix="git-squash-tests-", dir=_TMP_ROOT) as root:
+        yield Path(root)
+
+
+@pytest.fixture(scope="session")
+def template_repo(repo_root: Path):
+    """Pristine repository with an initial commit, built once per session.
+
+    Tests receive private copies through git_repo and must not mutate this one.
+    """
+    repo = GitTestRepository(repo_root / "template")
+    repo.init_repo()
+    repo.create_initial_commit()
+    return repo
 
 
 @pytest.fixture
-def git_repo():
-    """Create a temporary git repository."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        repo = GitTestRepository(Path(temp_dir) / "test_repo")
-        repo.init_repo()
-        repo.create_initial_commit()
+def git_repo(template_repo: GitTestRepository, repo_root: Path):
+    """Create a temporary git repository copied from the session template."""
+    with tempfile.TemporaryDirectory(dir=repo_root) as test_dir:
+        repo_path = Path(test_dir) / "test_repo"
+        shutil.copytree(template_repo.repo_path, repo_path)
+        repo = GitTestRepository(repo_path)
         yield repo
+        repo.close()
+
+
+@pytest.fixture(scope="session")
+def scenario_template(template_repo: GitTestRepository, repo_root: Path):
+    """Return a repository with the named scenario committed, built once per session."""
+    @cache
+    def build(name: str) -> GitTestRepository:
+        repo_path = repo_root / f"scenario-{name}"
+        shutil.copytree(template_repo.repo_path, repo_path)
+        repo = GitTestRepository(repo_path)
+        repo.switch_branch("scenario", fast=True)
+        apply_scenario(repo, get_scenario(name))
+        return repo
+    return build
 
 
 @pytest.fixture
-def squash_tool(git_repo: GitTestRepository):
-    """Create GitSquashTool instance."""
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(git_repo.repo_path)
+def load_scenario(git_repo: GitTestRepository, scenario_template):
+    """Load a cached scenario into git_repo on a new branch and return the scenario."""
+    def load(name: str, branch_name: str) -> Scenario:
+        git_repo.load_template(scenario_template(name), branch_name)
+        return get_scenario(name)
+    return load
 
-        config = GitSquashConfig()
-        git_ops = GitOperations(config)
-        ai_client = MockAIClient(config)
-        tool = GitSquashTool(git_ops, ai_client, config)
 
-        yield tool
-    finally:
-        os.chdir(original_cwd)
+@pytest.fixture
+def squash_tool(git_repo: GitTestRepository):
+    """Create GitSquashTool instance bound to the test repository."""
+    config = GitSquashConfig()
+    git_ops = GitOperations(config, cwd=git_repo.repo_path)
+    ai_client = MockAIClient(config)
+    return GitSquashTool(git_ops, ai_client, config)
 
 
 class TestGitSquashWorkflow:
     """Integration tests for git squash workflow."""
 
-    @pytest.mark.asyncio
-    async def test_simple_feature(self, git_repo: GitTestRepository, squash_tool: GitSquashTool):
+    def test_simple_feature(self, git_repo: GitTestRepository, squash_tool: GitSquashTool, load_scenario):
         """Test squashing a simple feature branch."""
-        changes = SCENARIOS["simple_feature"]
-
         # Create feature branch and apply changes
-        git_repo.switch_branch("feature/simple")
-        apply_scenario(git_repo, changes)
+        scenario = load_scenario("simple_feature", "feature/simple")
 
         # Create squash plan
-        plan = await squash_tool.prepare_squash_plan()
+        plan = asyncio.run(squash_tool.prepare_squash_plan())
         assert len(plan.items) >= 1
 
         # Execute squash
@@ -444,7 +704,7 @@ class TestGitSquashWorkflow:
 
         # Verify files are in final state
         git_repo.switch_branch(target_branch, create=False)
-        verify_final_state(git_repo, changes)
+        verify_final_state(git_repo, scenario.final_versions)
 
         # Test merge to main
         git_repo.switch_branch("main", create=False)
@@ -452,26 +712,22 @@ class TestGitSquashWorkflow:
         assert result.returncode == 0
 
         # Verify files on main
-        verify_final_state(git_repo, changes)
+        verify_final_state(git_repo, scenario.final_versions)
 
-    @pytest.mark.asyncio
-    async def test_real_world_workflow(self, git_repo: GitTestRepository, squash_tool: GitSquashTool):
+    def test_real_world_workflow(self, git_repo: GitTestRepository, squash_tool: GitSquashTool, load_scenario):
         """Test the complete workflow matching test_integration.py test_simple_workflow."""
-        changes = SCENARIOS["real_world_dev"]
-
         # Create dev branch and apply changes
-        git_repo.switch_branch("dev")
-        apply_scenario(git_repo, changes)
+        scenario = load_scenario("real_world_dev", "dev")
 
         # Verify we have the expected commits
         commit_count = git_repo.get_commit_count()
         assert commit_count == 5  # 4 dev commits + 1 initial
 
         # Get today's date for filtering
-        today = date.today().strftime('%Y-%m-%d')
+        today = TODAY.strftime('%Y-%m-%d')
 
         # Prepare squash plan for today's commits
-        plan = await squash_tool.prepare_squash_plan(start_date=today)
+        plan = asyncio.run(squash_tool.prepare_squash_plan(start_date=today))
 
         # Verify plan looks correct
         assert len(plan.items) >= 1  # Should have at least one day
@@ -494,9 +750,8 @@ class TestGitSquashWorkflow:
         assert git_repo.file_exists("CHANGELOG.md")
 
         app_content = git_repo.get_file_content("app.js")
-        assert "Lorem ipsum dolor sit amet." in app_content  # V1
-        assert "Consectetur adipiscing elit" in app_content  # V2
-        assert "Tempor incididunt" in app_content  # V3
+        missing = [s for s in V3_MARKERS if s not in app_content]
+        assert not missing, f"missing: {missing}"
 
         changelog_content = git_repo.get_file_content("CHANGELOG.md")
         assert "Lorem ipsum" in changelog_content
@@ -519,24 +774,20 @@ class TestGitSquashWorkflow:
         assert git_repo.file_exists("CHANGELOG.md")
 
         # Verify final file content is correct
-        verify_final_state(git_repo, changes)
+        verify_final_state(git_repo, scenario.final_versions)
 
         # Verify clean merge history
-        history = git_repo.get_log_graph()
-        assert "Merge squashed feature" in history
+        assert git_repo.get_commit_subjects(1) == ["Merge squashed feature"]
 
     @pytest.mark.asyncio
-    async def test_multi_day_incremental(self, git_repo: GitTestRepository, squash_tool: GitSquashTool):
+    async def test_multi_day_incremental(self, git_repo: GitTestRepository, squash_tool: GitSquashTool, load_scenario):
         """Test incremental squashing over multiple days."""
-        scenario = SCENARIOS["three_day_development"]
-
         # Apply all changes on dev branch
-        git_repo.switch_branch("dev")
-        apply_scenario(git_repo, scenario)
+        scenario = load_scenario("three_day_development", "dev")
 
         # Process each day incrementally
-        accumulated_changes = []
-        base_date = date.today()
+        expected_versions: Dict[str, Version] = {}
+        base_date = TODAY
 
         for days_ago in [2, 1, 0]:  # Process from oldest to newest
             # Calculate date for this day
@@ -560,30 +811,25 @@ class TestGitSquashWorkflow:
                 target_branch, f"Day {3-days_ago} work")
             assert result.returncode == 0
 
-            # Accumulate changes for this day and verify
-            day_changes = [c for c in scenario if c.days_ago == days_ago]
-            accumulated_changes.extend(day_changes)
-            verify_final_state(git_repo, accumulated_changes)
+            # Fold this day's changes into the expected state and verify
+            expected_versions.update(
+                (change.path, change.version)
+                for change in scenario.changes if change.days_ago == days_ago)
+            verify_final_state(git_repo, expected_versions)
 
             # Back to dev for next day
             if days_ago > 0:
                 git_repo.switch_branch("dev", create=False)
 
         # Verify clean merge history shows all merges
-        history = git_repo.get_log_graph()
-        assert "Day 1 work" in history
-        assert "Day 2 work" in history
-        assert "Day 3 work" in history
+        assert git_repo.get_commit_subjects(3) == ["Day 3 work", "Day 2 work", "Day 1 work"]
 
     @pytest.mark.asyncio
-    async def test_date_filtering(self, git_repo: GitTestRepository, squash_tool: GitSquashTool):
+    async def test_date_filtering(self, git_repo: GitTestRepository, squash_tool: GitSquashTool, load_scenario):
         """Test date range filtering for squash plans."""
-        scenario = SCENARIOS["multi_day_feature"]
-
-        git_repo.switch_branch("feature/date-test")
-        apply_scenario(git_repo, scenario)
+        scenario = load_scenario("multi_day_feature", "feature/date-test")
 
-        base_date = date.today()
+        base_date = TODAY
 
         # Test: Get only yesterday's commits
         yesterday_str = (base_date - timedelta(days=1)).strftime('%Y-%m-%d')
@@ -593,7 +839,7 @@ class TestGitSquashWorkflow:
         )
 
         # Should only include commits from yesterday
-        yesterday_commits = [c for c in scenario if c.days_ago == 1]
+        yesterday_commits = [c for c in scenario.commits if c[0].days_ago == 1]
         assert len(plan_yesterday.items) == 1
         assert len(plan_yesterday.items[0].commits) == len(yesterday_commits)
 
@@ -607,14 +853,13 @@ class TestGitSquashWorkflow:
 
         # Should exclude today's commits
         range_commits = [
-            c for c in scenario if c.days_ago is not None and c.days_ago >= 1]
+            c for c in scenario.commits if c[0].days_ago is not None and c[0].days_ago >= 1]
         total_commits_in_range = len(range_commits)
         total_commits_in_plan = sum(len(item.commits)
                                     for item in plan_range.items)
         assert total_commits_in_plan == total_commits_in_range
 
-    @pytest.mark.asyncio
-    async def test_custom_date_scenario(self, git_repo: GitTestRepository, squash_tool: GitSquashTool):
+    def test_custom_date_scenario(self, git_repo: GitTestRepository, squash_tool: GitSquashTool):
         """Test creating a custom scenario with specific date pattern."""
         # Create a scenario with a specific commit pattern
         scenario = (
@@ -634,25 +879,24 @@ class TestGitSquashWorkflow:
             .build()
         )
 
-        git_repo.switch_branch("feature/custom")
+        git_repo.switch_branch("feature/custom", fast=True)
         apply_scenario(git_repo, scenario)
 
         # Test weekly squashing
-        base_date = date.today()
+        base_date = TODAY
 
         # Week 1 plan
         week1_start = (base_date - timedelta(days=7)).strftime('%Y-%m-%d')
         week1_end = (base_date - timedelta(days=5)).strftime('%Y-%m-%d')
-        plan_week1 = await squash_tool.prepare_squash_plan(
+        plan_week1 = asyncio.run(squash_tool.prepare_squash_plan(
             start_date=week1_start,
             end_date=week1_end
-        )
+        ))
 
         # Should have commits from days 7, 6, and 5 ago
-        week1_commits = [c for c in scenario if c.days_ago in [7, 6, 5]]
+        week1_commits = [c for c in scenario.commits if c[0].days_ago in [7, 6, 5]]
 
-    @pytest.mark.asyncio
-    async def test_generated_daily_scenario(self, git_repo: GitTestRepository, squash_tool: GitSquashTool):
+    def test_generated_daily_scenario(self, git_repo: GitTestRepository, squash_tool: GitSquashTool):
         """Test with a generated daily commit scenario."""
         # Generate a 5-day scenario with 3 files per day and 2 updates per day
         scenario = create_daily_scenario(
@@ -662,11 +906,11 @@ class TestGitSquashWorkflow:
             updates_per_day=2
         )
 
-        git_repo.switch_branch("feature/generated")
+        git_repo.switch_branch("feature/generated", fast=True)
         apply_scenario(git_repo, scenario)
 
         # Process with combine flag to get single commit
-        plan = await squash_tool.prepare_squash_plan(combine=True)
+        plan = asyncio.run(squash_tool.prepare_squash_plan(combine=True))
         assert len(plan.items) == 1
 
         # Verify the date range
@@ -678,21 +922,18 @@ class TestGitSquashWorkflow:
         squash_tool.execute_squash_plan(plan, target_branch)
 
         git_repo.switch_branch(target_branch, create=False)
-        verify_final_state(git_repo, scenario)
+        verify_final_state(git_repo, scenario.final_versions)
 
         # Verify we have the expected number of files
         # 5 days * 3 files per day = 15 unique files
-        unique_files = set(change.path for change in scenario)
+        unique_files = set(change.path for change in scenario.changes)
         assert len(unique_files) == 15
 
     @pytest.mark.asyncio
-    async def test_combine_flag(self, git_repo: GitTestRepository, squash_tool: GitSquashTool):
+    async def test_combine_flag(self, git_repo: GitTestRepository, squash_tool: GitSquashTool, load_scenario):
         """Test combining multiple days into single commit."""
         # Use a scenario that spans multiple days
-        scenario = SCENARIOS["multi_day_feature"]
-
-        git_repo.switch_branch("feature/multi-day")
-        apply_scenario(git_repo, scenario)
+        scenario = load_scenario("multi_day_feature", "feature/multi-day")
 
         # Without combine - should have multiple items (one per day)
         plan_separate = await squash_tool.prepare_squash_plan()
@@ -709,38 +950,19 @@ class TestGitSquashWorkflow:
 
         git_repo.switch_branch(target_branch, create=False)
         assert git_repo.get_commit_count("main..") == 1  # Single commit
-        verify_final_state(git_repo, scenario)
+        verify_final_state(git_repo, scenario.final_versions)
 
     @pytest.mark.asyncio
-    async def test_incremental_multi_day_merging_workflow(self, git_repo: GitTestRepository, squash_tool: GitSquashTool):
+    async def test_incremental_multi_day_merging_workflow(self, git_repo: GitTestRepository, squash_tool: GitSquashTool, load_scenario):
         """Test incremental squashing over 3 days with proper mergeability.
 
         This matches test_integration.py's test_incremental_multi_day_squashing_workflow.
         """
-        # Define commits for each day (3 days)
-        base_date = date.today() - timedelta(days=2)
+        # Commits span 3 days, starting 2 days ago
+        base_date = TODAY - timedelta(days=2)
 
-        # Create scenario
-        scenario = (
-            ScenarioBuilder("Multi-day Incremental")
-            # Day 1 commits
-            .days_ago(2)
-            .add("src/app.js", "Add initial app.js file")
-            .update("src/app.js", Version.V2, "Add world to app.js")
-            # Day 2 commits
-            .days_ago(1)
-            .add("src/utils.js", "Add utility functions")
-            .update("src/app.js", Version.V3, "Add greet function")
-            # Day 3 commits (today)
-            .today()
-            .add("CHANGELOG.md", "Add changelog")
-            .add("package.json", "Add package.json")
-            .build()
-        )
-
-        # Create and switch to dev branch
-        git_repo.switch_branch("dev")
-        apply_scenario(git_repo, scenario)
+        # Load the scenario on a dev branch
+        load_scenario("multi_day_incremental", "dev")
 
         # Verify we have the expected commits
         commit_count = git_repo.get_commit_count()
@@ -789,21 +1011,15 @@ class TestGitSquashWorkflow:
             git_repo.switch_branch(current_base_branch, create=False)
 
             # Count files before merge
-            files_before = []
-            for f in git_repo.repo_path.glob("**/*"):
-                if f.is_file() and '.git' not in str(f):
-                    files_before.append(f)
+            files_before = git_repo.count_tracked_files()
 
             # Perform the merge - this should not fail!
             merge_result = git_repo.merge_branch(target_branch, f"Merge day {day_idx + 1} feature")
             assert merge_result.returncode == 0, f"Day {day_idx + 1} merge failed"
 
             # Verify files were added correctly
-            files_after = []
-            for f in git_repo.repo_path.glob("**/*"):
-                if f.is_file() and '.git' not in str(f):
-                    files_after.append(f)
-            assert len(files_after) > len(files_before), f"Day {day_idx + 1} should have added files"
+            files_after = git_repo.count_tracked_files()
+            assert files_after > files_before, f"Day {day_idx + 1} should have added files"
 
             # Update base branch for next iteration
             current_base_branch = "main"  # Always use main as base since we merge each day
@@ -821,15 +1037,12 @@ class TestGitSquashWorkflow:
 
         # Verify final content is correct
         app_content = git_repo.get_file_content("src/app.js")
-        assert "Lorem ipsum dolor sit amet." in app_content  # V1
-        assert "Consectetur adipiscing elit" in app_content  # V2
-        assert "Tempor incididunt" in app_content  # V3
+        missing = [s for s in V3_MARKERS if s not in app_content]
+        assert not missing, f"missing: {missing}"
 
         # Verify clean merge history shows all merges
-        history = git_repo.get_log_graph()
-        assert "Merge day 1 feature" in history
-        assert "Merge day 2 feature" in history
-        assert "Merge day 3 feature" in history
+        assert git_repo.get_commit_subjects(3) == [
+            "Merge day 3 feature", "Merge day 2 feature", "Merge day 1 feature"]
 
         print("\n--- All days successfully processed! ---")
 
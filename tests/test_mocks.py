@@ -1,22 +1,23 @@
 """Test the Anthropic mock implementation."""
+import asyncio
 import pytest
-import sys
-from pathlib import Path
 
+from git_squash.core.types import ChangeAnalysis, CommitCategories
 
+
+@pytest.fixture(scope="class")
+def anthropic_mock():
+    """Install the anthropic mock once for the class, then restore the original."""
+    from git_squash.ai.mocks.anthropic import enable_anthropic_mock, disable_anthropic_mock
+    enable_anthropic_mock()
+    yield
+    disable_anthropic_mock()
+
+
+@pytest.mark.usefixtures("anthropic_mock")
 class TestAnthropicMocks:
     """Test the Anthropic mock package."""
     
-    def setup_method(self):
-        """Enable anthropic mock for testing."""
-        from git_squash.ai.mocks.anthropic import enable_anthropic_mock
-        enable_anthropic_mock()
-    
-    def teardown_method(self):
-        """Restore original anthropic library."""
-        from git_squash.ai.mocks.anthropic import disable_anthropic_mock
-        disable_anthropic_mock()
-    
     def test_mock_imports(self):
         """Test that mock imports work correctly."""
         # Import through the mocked anthropic module
@@ -82,20 +83,19 @@ class TestAnthropicMocks:
         assert "Too many requests" in str(exc_info.value)
         assert exc_info.value.status_code == 429
     
-    @pytest.mark.asyncio
-    async def test_mock_message_creation(self):
+    def test_mock_message_creation(self):
         """Test creating a message with the mock client."""
         from git_squash.ai.mocks import anthropic
         
         client = anthropic.AsyncAnthropic(api_key="test-key")
         
         # Create a message
-        response = await client.messages.create(
+        response = asyncio.run(client.messages.create(
             model="claude-3-opus-20240229",
             messages=[{"role": "user", "content": "Hello"}],
             max_tokens=100,
             system="You are a helpful assistant"
-        )
+        ))
         
         # Verify response
         assert isinstance(response, anthropic.types.Message)
@@ -104,7 +104,24 @@ class TestAnthropicMocks:
         assert isinstance(response.content[0], anthropic.types.TextBlock)
         assert isinstance(response.usage, anthropic.types.Usage)
         assert response.usage.total_tokens == 150
-    
+
+    def test_mock_message_responses_are_independent(self):
+        """Test that mutating one response does not leak into the next."""
+        from git_squash.ai.mocks import anthropic
+
+        client = anthropic.AsyncAnthropic(api_key="test-key")
+        kwargs = {"model": "claude-3-opus-20240229", "messages": [], "max_tokens": 100}
+
+        first = asyncio.run(client.messages.create(**kwargs))
+        first.content[0].text = "changed"
+        first.content.append(anthropic.TextBlock(text="extra"))
+        first.usage.total_tokens = 0
+
+        second = asyncio.run(client.messages.create(**kwargs))
+        assert len(second.content) == 1
+        assert second.content[0].text == "This is a mock response from the Anthropic API."
+        assert second.usage.total_tokens == 150
+
     def test_mock_beta_types(self):
         """Test beta types."""
         import anthropic
@@ -145,11 +162,9 @@ class TestAnthropicMocks:
         client = anthropic.AsyncAnthropic(api_key="mock-key")
         assert client.api_key == "mock-key"
     
-    @pytest.mark.asyncio
-    async def test_claude_client_generate_summary_with_mock(self):
+    def test_claude_client_generate_summary_with_mock(self):
         """Test generating a summary with mock client."""
         from git_squash.ai.claude import ClaudeClient
-        from git_squash.core.types import ChangeAnalysis, CommitCategories
         
         # Create test data
         categories = CommitCategories(
@@ -174,12 +189,12 @@ class TestAnthropicMocks:
         
         # Create client and generate summary
         client = ClaudeClient(api_key="mock-key")
-        summary = await client.generate_summary(
+        summary = asyncio.run(client.generate_summary(
             date="2025-01-01",
             analysis=analysis,
             commit_subjects=["Add feature"],
             diff_content="+ new code"
-        )
+        ))
         
         # Should get some response (mock or fallback)
         assert isinstance(summary, str)
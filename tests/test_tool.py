@@ -1,13 +1,17 @@
 """Comprehensive tests for the refactored git squash tool."""
 
 import pytest
+import subprocess
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 from git_squash import (
     GitSquashConfig, GitSquashTool, GitOperations,
     MockAIClient, CommitInfo, SquashPlan
 )
-from git_squash.core.types import GitOperationError, NoCommitsFoundError
+from git_squash.core.types import (
+    ChangeAnalysis, CommitCategories, GitOperationError,
+    InvalidDateRangeError, NoCommitsFoundError
+)
 from git_squash.core.analyzer import DiffAnalyzer, MessageFormatter
 
 
@@ -198,8 +202,6 @@ class TestMockAIClient:
     @pytest.mark.asyncio
     async def test_generate_summary_features(self):
         """Test summary generation with features."""
-        from git_squash.core.types import ChangeAnalysis, CommitCategories
-
         categories = CommitCategories(
             features=["Add cache layer", "Add error handling"],
             fixes=["Fix memory leak"],
@@ -308,8 +310,6 @@ class MockGitOperations(GitOperations):
     def _run_git_command(self, cmd, check=True):
         """Override to prevent actual git commands in tests."""
         # Mock result for common commands
-        import subprocess
-
         if cmd == ["rev-parse", "--git-dir"]:
             # For git repository validation
             result = subprocess.CompletedProcess(
@@ -479,8 +479,6 @@ class TestGitSquashTool:
     @pytest.mark.asyncio
     async def test_prepare_squash_plan_invalid_date_range(self):
         """Test squash plan with invalid date range."""
-        from git_squash.core.types import InvalidDateRangeError
-
         with pytest.raises(InvalidDateRangeError):
             await self.tool.prepare_squash_plan(start_date="2025-01-10")
 
@@ -553,8 +551,6 @@ class TestErrorHandling:
 
     def test_ai_client_fallback(self):
         """Test AI client fallback behavior."""
-        from git_squash.core.types import ChangeAnalysis, CommitCategories
-
         # Create a client that always fails
         class FailingAIClient(MockAIClient):
             def generate_summary(self, *args, **kwargs):